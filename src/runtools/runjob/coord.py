@@ -3,8 +3,9 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import partial
 from threading import Condition, Event, Lock
-from typing import Any, List
+from typing import Any, List, Sequence
 
 from runtools.runcore import JobRun
 from runtools.runcore.criteria import JobRunCriteria, PhaseCriterion, MetadataCriterion, LifecycleCriterion
@@ -35,17 +36,18 @@ class ApprovalPhase(BasePhase[Any]):
         super().__init__(phase_id, CoordTypes.APPROVAL.value, RunState.PENDING, phase_name)
         self._timeout = timeout
         self._event = Event()
+        self._approved = False
         self._stopped = False
 
     def _run(self, _: OutputContext):
         # TODO Add support for denial request (rejection)
         log.debug("[waiting_for_approval]")
 
-        approved = self._event.wait(self._timeout or None)
+        self._event.wait(self._timeout or None)
         if self._stopped:
             log.debug("[approval_cancelled]")
             raise ExecutionTerminated(TerminationStatus.STOPPED)
-        if not approved:
+        if not self._approved:
             log.debug('[approval_timeout]')
             raise ExecutionTerminated(TerminationStatus.TIMEOUT)
 
@@ -53,12 +55,13 @@ class ApprovalPhase(BasePhase[Any]):
 
     @control_api
     def approve(self):
+        self._approved = True
         self._event.set()
 
     @control_api
     @property
     def approved(self):
-        return self._event.is_set() and not self._stopped
+        return self._approved and not self._stopped
 
     def stop(self):
         self._stopped = True
@@ -78,6 +81,8 @@ class MutualExclusionPhase(BasePhase[JobInstanceContext]):
             raise ValueError("Parameter `no_overlap_id` cannot be empty")
         self._exclusion_id = exclusion_id
         self._protected_phase = protected_phase
+        self._children = (protected_phase,)
+        self._lock_name = f"mutex-{exclusion_id}"  # TODO Manage lock names better
         self._attrs = {MutualExclusionPhase.EXCLUSION_ID: self._exclusion_id}
         self._excl_running_phase_filter = PhaseCriterion(
             phase_type=CoordTypes.NO_OVERLAP.value,
@@ -86,8 +91,8 @@ class MutualExclusionPhase(BasePhase[JobInstanceContext]):
         )
 
     @property
-    def children(self) -> List[Phase]:
-        return [self._protected_phase]
+    def children(self) -> Sequence[Phase]:
+        return self._children
 
     @property
     def exclusion_id(self):
@@ -99,14 +104,14 @@ class MutualExclusionPhase(BasePhase[JobInstanceContext]):
 
     def _run(self, ctx: JobInstanceContext):
         log.debug("[mutex_check_started]")
-        with ctx.environment.lock(f"mutex-{self.exclusion_id}"):  # TODO Manage lock names better
+        with ctx.environment.lock(self._lock_name):
             c = JobRunCriteria()
             c += MetadataCriterion.all_except(ctx.metadata.instance_id)  # Excl self
             c += self._excl_running_phase_filter
             excl_runs = ctx.environment.get_active_runs(c)
 
             for exc_run in excl_runs:
-                log.debug(f"[overlap_found]: {exc_run.metadata}")
+                log.debug("[overlap_found]: %s", exc_run.metadata)
                 raise TerminateRun(TerminationStatus.OVERLAP)
 
             self._protected_phase.run(ctx)
@@ -131,14 +136,15 @@ class DependencyPhase(BasePhase[JobInstanceContext]):
         return self._dependency_match
 
     def _run(self, ctx):
-        log.debug(f"[active_dependency_search] dependency=[{self._dependency_match}]")
+        log.debug("[active_dependency_search] dependency=[%s]", self._dependency_match)
 
         matching_runs = [r for r in ctx.environment.get_active_runs(self._dependency_match) if
                          r.instance_id != ctx.metadata.instance_id]
         if not matching_runs:
-            log.debug(f"[active_dependency_not_found] dependency=[{self._dependency_match}]")
+            log.debug("[active_dependency_not_found] dependency=[%s]", self._dependency_match)
             raise TerminateRun(TerminationStatus.UNSATISFIED)
-        log.debug(f"[active_dependency_found] instances={[r.instance_id for r in matching_runs]}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[active_dependency_found] instances=%s", [r.instance_id for r in matching_runs])
 
     def stop(self):
         pass
@@ -157,13 +163,15 @@ class WaitingPhase(BasePhase[OutputContext]):
         self._observable_conditions = observable_conditions
         self._timeout = timeout
         self._conditions_lock = Lock()
+        # vv Guarded by the conditions lock vv
+        self._unresolved = {id(c) for c in observable_conditions}
         self._event = Event()
         self._term_status = TerminationStatus.NONE
 
     def _run(self, ctx):
         for condition in self._observable_conditions:
-            condition.add_result_listener(self._result_observer)
-            condition.start_evaluating()
+            condition.add_result_listener(partial(self._result_observer, condition))
+            condition.start_evaluation()
 
         resolved = self._event.wait(self._timeout or None)
         if not resolved:
@@ -173,19 +181,20 @@ class WaitingPhase(BasePhase[OutputContext]):
         if self._term_status:
             raise TerminateRun(self._term_status)
 
-    def _result_observer(self, *_):
-        wait = False
+    def _result_observer(self, condition, *_):
+        result = condition.result
+        if not result:
+            return
+
         with self._conditions_lock:
-            for condition in self._observable_conditions:
-                if not condition.result:
-                    wait = True
-                elif not condition.result.success:
-                    self._term_status = TerminationStatus.UNSATISFIED
-                    wait = False
-                    break
+            if result.success:
+                self._unresolved.discard(id(condition))
+                if self._unresolved:
+                    return
+            else:
+                self._term_status = TerminationStatus.UNSATISFIED
 
-        if not wait:
-            self._event.set()
+        self._event.set()
 
     def stop(self):
         self._stop_all()
@@ -222,7 +231,7 @@ class ConditionResult(Enum):
         return obj
 
     def __bool__(self):
-        return self != ConditionResult.NONE
+        return self is not ConditionResult.NONE
 
 
 class ObservableCondition(ABC):
@@ -319,6 +328,8 @@ class ExecutionQueue(BasePhase[JobInstanceContext]):
 
         self._execution_group = execution_group
         self._limited_phase = limited_phase
+        self._children = (limited_phase,)
+        self._lock_name = f"eq-{execution_group}.lock"
         self._attrs = {
             ExecutionQueue.GROUP_ID: execution_group.group_id,
             ExecutionQueue.MAX_EXEC: execution_group.max_executions,
@@ -330,18 +341,16 @@ class ExecutionQueue(BasePhase[JobInstanceContext]):
         )
         self._phase_filter_running = copy.copy(self._phase_filter)
         self._phase_filter_running.lifecycle = LifecycleCriterion(stage=Stage.RUNNING)
+        self._running_criteria = JobRunCriteria(phase_criteria=self._phase_filter_running)
 
         self._queue_change_condition = Condition()
         # vv Guarding these fields vv
         self._state = QueuedState.NONE
         self._queue_changed = True
 
-    def _lock_name(self):
-        return f"eq-{self.execution_group}.lock"
-
     @property
-    def children(self) -> List[Phase]:
-        return [self._limited_phase]
+    def children(self) -> Sequence[Phase]:
+        return self._children
 
     @property
     def attributes(self):
@@ -387,7 +396,7 @@ class ExecutionQueue(BasePhase[JobInstanceContext]):
 
                     self._queue_changed = False
 
-                with ctx.environment.lock(self._lock_name()):
+                with ctx.environment.lock(self._lock_name):
                     self._dispatch_next(ctx)
         finally:
             ctx.environment.remove_observer_transition(self._new_instance_transition)
@@ -414,21 +423,25 @@ class ExecutionQueue(BasePhase[JobInstanceContext]):
             return True
 
     def _dispatch_next(self, ctx):
-        runs: List[JobRun] = ctx.environment.get_active_runs(JobRunCriteria(phase_criteria=self._phase_filter_running))
-        runs_sorted = sorted(runs, key=lambda run: run.find_phase(self._phase_filter).lifecycle.created_at)
-        ids_dispatched = {r.instance_id for r in runs_sorted if
-                      r.find_phase(self._phase_filter).variables[ExecutionQueue.STATE] == QueuedState.DISPATCHED.name}
-        free_slots = self._execution_group.max_executions - len(ids_dispatched)
+        runs: List[JobRun] = ctx.environment.get_active_runs(self._running_criteria)
+        dispatched_count = 0
+        waiting = []  # (created_at, run) of the runs not dispatched yet
+        for run in runs:
+            queue_phase = run.find_phase(self._phase_filter)
+            if queue_phase.variables[ExecutionQueue.STATE] == QueuedState.DISPATCHED.name:
+                dispatched_count += 1
+            else:
+                waiting.append((queue_phase.lifecycle.created_at, run))
+        free_slots = self._execution_group.max_executions - dispatched_count
 
         if free_slots <= 0:
             log.debug("event[exec_limit_reached] slots=[%d] dispatched=[%d]",
-                      self._execution_group.max_executions, len(ids_dispatched))
+                      self._execution_group.max_executions, dispatched_count)
             return False
 
         log.debug("event[dispatching_from_queue] count=[%d]", free_slots)
-        for next_dispatch in runs_sorted:
-            if next_dispatch.instance_id in ids_dispatched:
-                continue
+        waiting.sort(key=lambda created_run: created_run[0])
+        for _, next_dispatch in waiting:
             dispatched = (
                 ctx.environment.get_instance(next_dispatch.instance_id).find_phase_control(self._phase_filter).signal_dispatch())
             if dispatched:
@@ -438,9 +451,12 @@ class ExecutionQueue(BasePhase[JobInstanceContext]):
                     return
 
     def _new_instance_transition(self, event: InstanceTransitionEvent):
+        # Filter out unrelated transitions before contending for the condition lock
+        if event.new_stage != Stage.ENDED or not self._phase_filter(event.job_run.find_phase_by_id(event.phase_id)):
+            return
+
         with self._queue_change_condition:
-            if self._queue_changed or event.new_stage != Stage.ENDED or not self._phase_filter(
-                    event.job_run.find_phase_by_id(event.phase_id)):
+            if self._queue_changed:
                 return
 
             log.debug("event[queue_slot_freed] instance=[%s] phase=[%s]", event.instance.instance_id, event.phase_id)
@@ -8,7 +8,6 @@ and clients as producers.
 """
 
 import abc
-import json
 import logging
 
 from runtools.runcore import util, paths
@@ -16,6 +15,7 @@ from runtools.runcore.job import JobInstanceMetadata, JobRun, InstanceTransition
     InstanceTransitionEvent, InstanceOutputEvent
 from runtools.runcore.output import OutputLine
 from runtools.runcore.util.socket import SocketClient, PayloadTooLarge
+from runtools.runjob import jsonutil
 
 TRANSITION_LISTENER_FILE_EXTENSION = '.tlistener'
 OUTPUT_LISTENER_FILE_EXTENSION = '.olistener'
@@ -32,17 +32,26 @@ class EventDispatcher(abc.ABC):
     @abc.abstractmethod
     def __init__(self, client):
         self._client = client
+        self._last_meta = (None, None)  # (metadata, serialized) of the last dispatched instance
+
+    def _serialize_meta(self, instance_meta):
+        # Consecutive events mostly belong to the same instance, metadata objects are immutable
+        meta, meta_serialized = self._last_meta
+        if meta is not instance_meta:
+            meta_serialized = instance_meta.serialize()
+            self._last_meta = (instance_meta, meta_serialized)
+        return meta_serialized
 
     def _send_event(self, event_type, instance_meta, event_serialized):
         event_body = {
             "event_metadata": {
                 "event_type": event_type
             },
-            "instance_metadata": instance_meta.serialize(),
+            "instance_metadata": self._serialize_meta(instance_meta),
             "event": event_serialized
         }
         try:
-            self._client.communicate(json.dumps(event_body))
+            self._client.communicate(jsonutil.dumps(event_body))
         except PayloadTooLarge:
             log.warning("event=[event_dispatch_failed] reason=[payload_too_large] note=[Please report this issue!]")
 
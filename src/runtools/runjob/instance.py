@@ -232,6 +232,9 @@ class _JobInstance(JobInstance):
     def find_phase_control(self, phase_filter):
         return self._root_phase.find_phase_control(phase_filter)
 
+    def find_phase_control_by_id(self, phase_id):
+        return self._root_phase.find_phase_control_by_id(phase_id)
+
     @property
     def output(self):
         return self._ctx.output_sink
@@ -316,16 +319,20 @@ class _JobInstance(JobInstance):
         self._transition_notification.remove_observer(observer)
 
     def _on_phase_update(self, e: PhaseTransitionEvent):
-        log.debug(self._log('instance_phase_update', "event=[{}]", e))
+        # The messages are formatted eagerly by `_log`, the event string includes the whole phase detail
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug(self._log('instance_phase_update', "event=[{}]", e))
 
         is_root_phase = e.phase_detail.phase_id == ROOT_PHASE_ID
         if is_root_phase:
-            log.debug(self._log('instance_stage_update', "new_stage=[{}]", e.new_stage))
+            if debug:
+                log.debug(self._log('instance_stage_update', "new_stage=[{}]", e.new_stage))
 
             if term := e.phase_detail.lifecycle.termination:
                 if term.status.is_outcome(Outcome.NON_SUCCESS):
                     log.warning(self._log('instance_terminated_unsuccessfully', "termination=[{}]", term))
-                else:
+                elif debug:
                     log.debug(self._log('instance_terminated_successfully', "termination=[{}]", term))
 
         snapshot = self.snapshot()
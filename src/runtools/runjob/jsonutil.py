@@ -0,0 +1,47 @@
+"""
+JSON encoding and decoding shared by the RPC server and the event dispatchers.
+The optional `orjson` library is used when installed, otherwise the standard library is used.
+Both backends reject the non-standard NaN and Infinity constants and write non-finite floats as null.
+Note that orjson parses integers beyond the 64-bit range as floats.
+"""
+
+import json
+import math
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, the standard library is used when not installed
+    orjson = None
+
+if orjson:
+    loads = orjson.loads  # Accepts both `str` and `bytes`
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def canonical_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+else:
+    def _reject_constant(name):
+        raise json.JSONDecodeError(f"Non-standard constant: {name}", name, 0)
+
+    def loads(data):
+        return json.loads(data, parse_constant=_reject_constant)
+
+    def dumps(obj) -> str:
+        try:
+            return json.dumps(obj, allow_nan=False)
+        except ValueError:  # Contains a non-finite float
+            return json.dumps(_finite_floats(obj))
+
+    def _finite_floats(obj):
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {k: _finite_floats(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_finite_floats(v) for v in obj]
+        return obj
+
+    def canonical_dumps(obj) -> str:
+        return json.dumps(obj, sort_keys=True)
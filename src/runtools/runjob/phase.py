@@ -1,8 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from multiprocessing import Lock  # TODO
-from typing import Optional, Generic, List
+from threading import Lock
+from typing import Optional, Generic, List, Sequence, Dict
 
 from runtools.runcore.job import Stage
 from runtools.runcore.run import TerminationStatus, TerminationInfo, Fault, RunState, C, PhaseControl, \
@@ -23,6 +23,7 @@ class PhaseCompletionError(Exception):
 
 
 class Phase(ABC, Generic[C]):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -81,7 +82,7 @@ class Phase(ABC, Generic[C]):
         pass
 
     def find_phase_control_by_id(self, phase_id: str) -> Optional[PhaseControl]:
-        self.find_phase_control(lambda phase: phase.id == phase_id)
+        return self.find_phase_control(lambda phase: phase.phase_id == phase_id)
 
     @abstractmethod
     def run(self, ctx: Optional[C]):
@@ -125,6 +126,9 @@ class ExecutionTerminated(Exception):
 class BasePhase(Phase[C], ABC):
     """Base implementation providing common functionality for V2 phases"""
 
+    __slots__ = ('_id', '_type', '_run_state', '_name', '_created_at', '_started_at', '_termination', '_notification',
+                 '_id_to_phase', '__weakref__')
+
     def __init__(self, phase_id: str, phase_type: str, run_state: RunState, name: Optional[str] = None):
         self._id = phase_id
         self._type = phase_type
@@ -134,6 +138,7 @@ class BasePhase(Phase[C], ABC):
         self._started_at: Optional[datetime] = None
         self._termination: Optional[TerminationInfo] = None
         self._notification = ObservableNotification[PhaseTransitionObserver]()
+        self._id_to_phase: Optional[Dict[str, Phase]] = None  # Built on first lookup, the phase tree doesn't change
 
     @abstractmethod
     def _run(self, ctx: Optional[C]):
@@ -181,12 +186,13 @@ class BasePhase(Phase[C], ABC):
         return self._termination.terminated_at - self._started_at
 
     @property
-    def children(self) -> List[Phase]:
-        return []
+    def children(self) -> Sequence[Phase]:
+        return ()
 
     def find_phase_control(self, phase_filter) -> Optional[PhaseControl]:
         """
         Find phase control, searching recursively through all children.
+        The detail of this phase is created only once and the filter is applied to the child details it contains.
 
         Args:
             phase_filter: The filter to find the phase
@@ -194,21 +200,18 @@ class BasePhase(Phase[C], ABC):
         Returns:
             PhaseControl for the matching phase, or None if not found
         """
-        phase = None
-        if phase_filter(self.detail()):
-            phase = self
-        else:
-            for child in self.children:
-                if phase_filter(child.detail()):
-                    phase = child
-                    break
-                if phase_control := child.find_phase_control(phase_filter):
-                    return phase_control
-
-        if not phase:
-            return None
+        phase = _find_phase(self, self.detail(), phase_filter)
+        return phase.control if phase else None
 
-        return phase.control
+    def find_phase_control_by_id(self, phase_id: str) -> Optional[PhaseControl]:
+        """
+        Find phase control of this phase or any of its descendants by the phase ID.
+        The lookup uses an index of the phase tree, no phase details are created.
+        """
+        if self._id_to_phase is None:
+            self._id_to_phase = _index_phases(self)
+        phase = self._id_to_phase.get(phase_id)
+        return phase.control if phase else None
 
     def detail(self) -> PhaseDetail:
         """
@@ -256,6 +259,30 @@ class BasePhase(Phase[C], ABC):
         self._notification.remove_observer(observer)
 
 
+def _find_phase(root, root_detail, phase_filter):
+    """Depth-first pre-order search, the first phase whose detail matches the filter is returned"""
+    stack = [(root, root_detail)]
+    while stack:
+        phase, detail = stack.pop()
+        if phase_filter(detail):
+            return phase
+        stack.extend(reversed(tuple(zip(phase.children, detail.children))))
+
+    return None
+
+
+def _index_phases(root) -> Dict[str, Phase]:
+    """Maps IDs to phases of the tree, the first phase in pre-order wins for a duplicated ID"""
+    id_to_phase = {}
+    stack = [root]
+    while stack:
+        phase = stack.pop()
+        id_to_phase.setdefault(phase.id, phase)
+        stack.extend(reversed(phase.children))
+
+    return id_to_phase
+
+
 class SequentialPhase(BasePhase):
     """
     A phase that executes its children sequentially.
@@ -263,10 +290,11 @@ class SequentialPhase(BasePhase):
     """
 
     TYPE = 'SEQUENTIAL'
+    __slots__ = ('_children', '_current_child', '_stop_lock', '_stopped')
 
     def __init__(self, phase_id: str, children: List[Phase[C]], name: Optional[str] = None):
         super().__init__(phase_id, SequentialPhase.TYPE, RunState.EXECUTING, name)
-        self._children = children
+        self._children = tuple(children)
         self._current_child: Optional[Phase[C]] = None
         self._stop_lock = Lock()
         self._stopped = False
@@ -274,8 +302,9 @@ class SequentialPhase(BasePhase):
             c.add_phase_observer(self._notification.observer_proxy)
 
     @property
-    def children(self) -> List[Phase[C]]:
-        return self._children.copy()
+    def children(self) -> Sequence[Phase[C]]:
+        """Read-only sequence of the child phases"""
+        return self._children
 
     def _run(self, ctx: Optional[C]):
         """
@@ -301,9 +330,15 @@ class SequentialPhase(BasePhase):
         """
         Stop the current child phase if one is executing
         """
+        if self._termination:  # Already terminated, nothing to stop; re-checked under the lock otherwise
+            return
+
         with self._stop_lock:
             self._stopped = True
-            if self._current_child:
-                self._current_child.stop()
-            else:
+            current_child = self._current_child
+            if not current_child and not self._termination:  # Not started yet
                 self._termination = TerminationInfo(TerminationStatus.STOPPED, utc_now())
+
+        # The stop flag is already set, so no further child can be started and the lock needn't be held while stopping
+        if current_child:
+            current_child.stop()
@@ -1,19 +1,22 @@
 import json
 import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from json import JSONDecodeError
-from typing import Dict, Any, List, Union
-
-from itertools import zip_longest
+from threading import Lock
+from typing import Dict, Any, List, Union, Tuple, Optional, Callable
 
 from runtools.runcore import paths
 from runtools.runcore.criteria import JobRunCriteria
 from runtools.runcore.job import JobInstanceManager, JobInstance
 from runtools.runcore.run import util
+from runtools.runcore.util import MatchingStrategy
 from runtools.runcore.util.json import ErrorCode, JsonRpcError
 from runtools.runcore.util.socket import SocketServer
+from runtools.runjob import jsonutil
 
 log = logging.getLogger(__name__)
 
@@ -24,7 +27,30 @@ def _create_socket_name():
     return util.unique_timestamp_hex() + RPC_FILE_EXTENSION
 
 
-@dataclass
+def _exact_job_id(criteria: JobRunCriteria) -> Optional[str]:
+    """
+    Returns:
+        The job ID when the criteria can match only runs of that job, otherwise None.
+        Metadata criteria are alternatives, therefore only a single exact job ID criterion narrows the match.
+    """
+    if len(criteria.metadata_criteria) != 1:
+        return None
+    metadata_criterion = criteria.metadata_criteria[0]
+    if metadata_criterion.strategy != MatchingStrategy.EXACT or metadata_criterion.match_any_field:
+        return None
+    return metadata_criterion.job_id or None
+
+
+@lru_cache(maxsize=256)
+def _compile_run_match(run_match_key) -> JobRunCriteria:
+    """
+    Clients tend to repeat the same run match, so the deserialized criteria are cached by the canonical JSON form
+    of the run match. The criteria are only used for matching and must not be modified.
+    """
+    return JobRunCriteria.deserialize(jsonutil.loads(run_match_key))
+
+
+@dataclass(slots=True)
 class MethodParameter:
     """Defines a parameter for a JSON-RPC method"""
     name: str
@@ -32,6 +58,9 @@ class MethodParameter:
     required: bool = True
     default: Any = None
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+
 
 RUN_MATCH_PARAM = MethodParameter('run_match', dict)
 INSTANCE_ID_PARAM = MethodParameter('instance_id', str)
@@ -159,6 +188,20 @@ class ExecPhaseOpMethod(JsonRpcMethod):
         return {"retval": str(result)}
 
 
+@dataclass(frozen=True, slots=True)
+class _MethodSpec:
+    """Method with its parameter metadata and executor resolved once when the server is created"""
+    method: JsonRpcMethod
+    parameters: Tuple[MethodParameter, ...]
+    name_to_param: Dict[str, MethodParameter]
+    executor: Callable[[JsonRpcMethod, List[Any]], Any]
+
+    @classmethod
+    def of(cls, method: JsonRpcMethod, executor):
+        parameters = tuple(method.parameters)
+        return cls(method, parameters, {p.name: p for p in parameters}, executor)
+
+
 DEFAULT_METHODS = (
     GetActiveRunsMethod(),
     StopInstanceMethod(),
@@ -167,40 +210,39 @@ DEFAULT_METHODS = (
 )
 
 
-def _is_valid_request_id(request_id: Any) -> bool:
-    return request_id is None or isinstance(request_id, (str, int, float))
+_REQUEST_ID_TYPES = (str, int, float, type(None))
+_PARAMS_TYPES = (dict, list, type(None))
+
+
+# The envelope is constant, only the member values are encoded per response
+_SUCCESS_RESPONSE_PREFIX = '{"jsonrpc":"2.0","result":'
+_ERROR_RESPONSE_PREFIX = '{"jsonrpc":"2.0","error":'
 
 
-def _is_valid_params(params: Any) -> bool:
-    return params is None or isinstance(params, (dict, list))
+def _response_end(request_id: Any) -> str:
+    if not request_id:
+        return '}'
+    if type(request_id) is int:  # Written directly, orjson can't encode integers beyond 64 bits
+        return ',"id":' + str(request_id) + '}'
+    return ',"id":' + jsonutil.dumps(request_id) + '}'
 
 
 def _success_response(request_id: str, result: Any) -> str:
-    response = {
-        "jsonrpc": "2.0",
-        "result": result
-    }
-    if request_id:
-        response["id"] = request_id
-    return json.dumps(response)
+    return _SUCCESS_RESPONSE_PREFIX + jsonutil.dumps(result) + _response_end(request_id)
 
 
 def _error_response(request_id: Any, code: ErrorCode, message: str, data: Any = None) -> str:
-    response = {
-        "jsonrpc": "2.0",
-        "error": {
-            "code": code.int_code,
-            "message": message
-        }
+    error = {
+        "code": code.int_code,
+        "message": message
     }
     if data:
-        response["error"]["data"] = data
-    if request_id:
-        response["id"] = request_id
-    return json.dumps(response)
+        error["data"] = data
+    return _ERROR_RESPONSE_PREFIX + jsonutil.dumps(error) + _response_end(request_id)
 
 
-def validate_params(parameters, arguments: Union[List, Dict[str, Any]]) -> List[Any]:
+def validate_params(parameters, arguments: Union[List, Dict[str, Any]],
+                    name_to_param: Optional[Dict[str, MethodParameter]] = None) -> List[Any]:
     """
     Validate and transform input parameters according to method specification.
     Supports both positional (list) and named (dict) parameters.
@@ -208,6 +250,7 @@ def validate_params(parameters, arguments: Union[List, Dict[str, Any]]) -> List[
     Args:
         parameters: The parameters of the method for which the arguments were provided
         arguments: Input parameters as either list (positional) or dict (named)
+        name_to_param: Optional pre-built mapping of the parameter names to the parameters
 
     Returns:
         List of validated parameters in the order defined by method.parameters
@@ -215,34 +258,36 @@ def validate_params(parameters, arguments: Union[List, Dict[str, Any]]) -> List[
     Raises:
         JsonRpcError: If parameters are invalid
     """
-    name_to_param = {p.name: p for p in parameters}
-    validated_args = []
-
     # Convert named arguments to positional
     if isinstance(arguments, dict):
-        if unknown_params := (set(arguments.keys()) - {'run_match'}) - set(name_to_param.keys()):
+        if name_to_param is None:
+            name_to_param = {p.name: p for p in parameters}
+        if unknown_params := [key for key in arguments if key not in name_to_param and key != 'run_match']:
             raise JsonRpcError(ErrorCode.INVALID_PARAMS, f"Unknown parameters: {', '.join(unknown_params)}")
 
         arguments = [arguments.get(param.name) for param in parameters]
 
-    for param, value in zip_longest(parameters, arguments):
-        if param is None:
-            raise JsonRpcError(
-                ErrorCode.INVALID_PARAMS,
-                f"Too many parameters. Expected {len(parameters)}, got {len(arguments)}"
-            )
+    args_count = len(arguments)
+    if args_count > len(parameters):
+        raise JsonRpcError(
+            ErrorCode.INVALID_PARAMS,
+            f"Too many parameters. Expected {len(parameters)}, got {args_count}"
+        )
 
+    validated_args = [None] * len(parameters)
+    for i, param in enumerate(parameters):
+        value = arguments[i] if i < args_count else None  # Omitted trailing arguments are treated as missing
         if value is None:
             if param.required and param.default is None:
                 raise JsonRpcError(ErrorCode.INVALID_PARAMS, f"Missing required parameter: {param.name}")
-            validated_args.append(param.default)
-        elif not isinstance(value, param.param_type):
+            validated_args[i] = param.default
+        elif type(value) is not param.param_type and not isinstance(value, param.param_type):  # Exact type is common
             raise JsonRpcError(
                 ErrorCode.INVALID_PARAMS,
                 f"Parameter {param.name} must be of type {param.param_type.__name__}"
             )
         else:
-            validated_args.append(value)
+            validated_args[i] = value
 
     return validated_args
 
@@ -273,19 +318,41 @@ class RemoteCallServer(SocketServer, JobInstanceManager):
     """
     def __init__(self, methods=DEFAULT_METHODS):
         super().__init__(lambda: paths.socket_path(_create_socket_name(), create=True), allow_ping=True)
-        self._methods = {method.method_name: method for method in methods}
+        self._methods = {
+            sys.intern(method.method_name): _MethodSpec.of(method, self._method_executor(method)) for method in methods
+        }
+        self._instances_lock = Lock()
+        # vv Guarded by instances lock vv
         self._job_instances = {}
+        self._job_id_to_instances: Dict[str, Dict[str, JobInstance]] = {}
+
+    def _method_executor(self, method):
+        if method.type == JsonRpcMethodType.INSTANCE:
+            return self._execute_instance_method
+        if method.type == JsonRpcMethodType.COLLECTION:
+            return self._execute_collection_method
+        raise AssertionError("Missing implementation for method type: " + str(method.type))
 
     def register_instance(self, job_instance):
-        self._job_instances[job_instance.instance_id] = job_instance
+        instance_id = job_instance.instance_id
+        with self._instances_lock:
+            self._job_instances[instance_id] = job_instance
+            self._job_id_to_instances.setdefault(job_instance.metadata.job_id, {})[instance_id] = job_instance
 
     def unregister_instance(self, job_instance):
-        del self._job_instances[job_instance.instance_id]
-
-    def handle(self, req: str) -> str:
+        job_id = job_instance.metadata.job_id
+        with self._instances_lock:
+            del self._job_instances[job_instance.instance_id]
+            if (job_instances := self._job_id_to_instances.get(job_id)) is not None:
+                job_instances.pop(job_instance.instance_id, None)
+                if not job_instances:
+                    del self._job_id_to_instances[job_id]
+
+    def handle(self, req: Union[str, bytes]) -> str:
+        # A request can be passed undecoded, both JSON backends parse UTF-8 bytes directly
         try:
-            req_data = json.loads(req)
-        except JSONDecodeError:
+            req_data = jsonutil.loads(req)
+        except (JSONDecodeError, UnicodeDecodeError):  # The standard library raises the latter for invalid UTF-8
             return _error_response(None, ErrorCode.PARSE_ERROR, "Invalid JSON")
 
         # Validate JSON-RPC request
@@ -293,44 +360,54 @@ class RemoteCallServer(SocketServer, JobInstanceManager):
             return _error_response(req_data.get('id'), ErrorCode.INVALID_REQUEST, "Invalid JSON-RPC 2.0 request")
 
         request_id = req_data.get('id')
-        if not _is_valid_request_id(request_id):
+        if type(request_id) is float and jsonutil.orjson:  # orjson parses integers beyond 64 bits as floats
+            request_id = json.loads(req)['id']
+        if not isinstance(request_id, _REQUEST_ID_TYPES):
             return _error_response(request_id, ErrorCode.INVALID_REQUEST, "Invalid request ID")
 
         params = req_data.get('params', {})
-        if not _is_valid_params(params):
+        if not isinstance(params, _PARAMS_TYPES):
             return _error_response(request_id, ErrorCode.INVALID_REQUEST, "Invalid parameters")
 
         method_name = req_data['method']
-        method = self._methods.get(method_name)
-        if not method:
+        method_spec = self._methods.get(method_name)
+        if not method_spec:
             return _error_response(request_id, ErrorCode.METHOD_NOT_FOUND, f"Method not found: {method_name}")
 
         try:
-            validated_args = validate_params(method.parameters, params)
-            if method.type == JsonRpcMethodType.INSTANCE:
-                try:
-                    job_instance = self._job_instances[validated_args[0]]
-                except KeyError:
-                    return _error_response(request_id, ErrorCode.TARGET_NOT_FOUND,
-                                           f"Instance not found: {validated_args[0]}")
-                exec_retval = method.execute(job_instance, *validated_args[1:])
-            elif method.type == JsonRpcMethodType.COLLECTION:
-                job_instances = self._matching_instances(validated_args[0])
-                exec_retval = method.execute(job_instances, *validated_args[1:])
-            else:
-                raise AssertionError("Missing implementation for method type: " + str(method.type))
+            validated_args = validate_params(method_spec.parameters, params, method_spec.name_to_param)
+            exec_retval = method_spec.executor(method_spec.method, validated_args)
         except JsonRpcError as e:
             return _error_response(request_id, e.code, e.message, e.data)
         except Exception as e:
-            log.error("event=[json_rpc_handler_error]", exc_info=True)
+            log.error("event=[json_rpc_handler_error] method=[%s]", method_name, exc_info=True)
             return _error_response(request_id, ErrorCode.METHOD_EXECUTION_ERROR, f"Internal error: {str(e)}")
 
         return _success_response(request_id, {"retval": exec_retval})
 
+    def _execute_instance_method(self, method, validated_args):
+        try:
+            with self._instances_lock:
+                job_instance = self._job_instances[validated_args[0]]
+        except KeyError:
+            raise JsonRpcError(ErrorCode.TARGET_NOT_FOUND, f"Instance not found: {validated_args[0]}")
+        return method.execute(job_instance, *validated_args[1:])
+
+    def _execute_collection_method(self, method, validated_args):
+        job_instances = self._matching_instances(validated_args[0])
+        return method.execute(job_instances, *validated_args[1:])
+
     def _matching_instances(self, run_match: Dict) -> List:
         try:
-            matching_criteria = JobRunCriteria.deserialize(run_match)
+            matching_criteria = _compile_run_match(jsonutil.canonical_dumps(run_match))
         except ValueError as e:
             raise JsonRpcError(ErrorCode.INVALID_PARAMS, f"Invalid run match criteria: {e}")
 
-        return [job_instance for job_instance in self._job_instances.values() if matching_criteria.matches(job_instance)]
+        job_id = _exact_job_id(matching_criteria)
+        with self._instances_lock:  # Held only for taking the candidates, matching is done outside the lock
+            if job_id:
+                candidates = list(self._job_id_to_instances.get(job_id, {}).values())
+            else:
+                candidates = list(self._job_instances.values())
+
+        return [job_instance for job_instance in candidates if matching_criteria.matches(job_instance)]
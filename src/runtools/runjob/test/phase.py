@@ -25,6 +25,7 @@ class TestPhase(BasePhase[JobInstanceContext]):
     Supports waiting, output generation, and various failure modes.
     """
     TYPE = 'TEST'
+    __slots__ = ('wait', 'output_text', 'exception', 'fail', 'completed')
 
     def __init__(self, phase_id: str = 'test_phase', *,
                  wait: bool = False,
@@ -23,15 +23,20 @@ class Fields(Enum):
     @classmethod
     def find_field(cls, key: str) -> 'Fields | None':
         """Find field enum by any of its aliases"""
-        key = key.lower()
-        for field in cls:
-            if key in field.aliases:
-                return field
-        return None
+        return _ALIAS_TO_FIELD.get(key.lower())
 
 
+# Reversed so that an alias shared by several fields resolves to the first declared one
+_ALIAS_TO_FIELD = {alias: field for field in reversed(Fields) for alias in field.aliases}
+
 DEFAULT_PATTERN = ''
 
+_FIELD_CONVERTERS = {
+    Fields.TIMESTAMP: util.parse_datetime,
+    Fields.COMPLETED: convert_if_number,
+    Fields.TOTAL: convert_if_number,
+}
+
 
 def field_conversion(parsed: dict) -> dict:
     """Convert parsed fields with alias support"""
@@ -39,10 +44,8 @@ def field_conversion(parsed: dict) -> dict:
 
     for key, value in parsed.items():
         if field := Fields.find_field(key):
-            if field == Fields.TIMESTAMP:
-                value = util.parse_datetime(value)
-            elif field in {Fields.COMPLETED, Fields.TOTAL}:
-                value = convert_if_number(value)
+            if converter := _FIELD_CONVERTERS.get(field):
+                value = converter(value)
             if value:
                 converted[field] = value
 
@@ -60,10 +63,15 @@ class OutputToStatusTransformer:
         self.new_output(output_line)
 
     def new_output(self, output_line):
-        parsed = {}
-        for parser in self.parsers:
-            if parsed_kv := parser(output_line.text):
-                parsed.update(parsed_kv)
+        text = output_line.text
+        parsers = self.parsers
+        if len(parsers) == 1:  # Common case, the parser result needn't be merged
+            parsed = parsers[0](text)
+        else:
+            parsed = {}
+            for parser in parsers:
+                if parsed_kv := parser(text):
+                    parsed.update(parsed_kv)
 
         if not parsed:
             return
@@ -178,7 +186,7 @@ class StatusTracker:
         timestamp = ts_or_now(timestamp)
         self._last_event = Event(text, timestamp)
         for op in self._operations:
-            if op.is_finished:
+            if op.is_active and op.is_finished:
                 op.is_active = False
 
     def warning(self, text: str, timestamp=None) -> None:
@@ -0,0 +1,153 @@
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+
+from runtools.runcore.run import TerminateRun, TerminationStatus
+from runtools.runjob.coord import WaitingPhase, ObservableCondition, ConditionResult, ExecutionQueue, \
+    ExecutionGroup, QueuedState
+from runtools.runjob.phase import PhaseCompletionError
+from runtools.runjob.test.phase import TestPhase
+
+
+class FakeCondition(ObservableCondition):
+
+    def __init__(self, result=ConditionResult.NONE):
+        self._result = result
+        self._listeners = []
+
+    def start_evaluation(self):
+        if self._result:
+            self._notify()
+
+    @property
+    def result(self):
+        return self._result
+
+    def resolve(self, result):
+        self._result = result
+        self._notify()
+
+    def _notify(self):
+        for listener in self._listeners:
+            listener(self)
+
+    def add_result_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_result_listener(self, listener):
+        self._listeners.remove(listener)
+
+
+def test_all_conditions_satisfied():
+    conditions = [FakeCondition(ConditionResult.SATISFIED), FakeCondition(ConditionResult.SATISFIED)]
+    waiting = WaitingPhase('waiting', conditions, timeout=2)
+
+    waiting.run(None)
+
+    assert waiting.termination.status == TerminationStatus.COMPLETED
+
+
+def test_unsatisfied_condition():
+    conditions = [FakeCondition(ConditionResult.SATISFIED), FakeCondition(ConditionResult.UNSATISFIED),
+                  FakeCondition()]
+    waiting = WaitingPhase('waiting', conditions)
+
+    with pytest.raises(PhaseCompletionError) as exc_info:
+        waiting.run(None)
+
+    assert isinstance(exc_info.value.__cause__, TerminateRun)
+
+
+def test_waits_for_all_conditions():
+    satisfied = FakeCondition(ConditionResult.SATISFIED)
+    pending = FakeCondition()
+    waiting = WaitingPhase('waiting', [satisfied, pending])
+
+    t = Thread(target=waiting.run, args=(None,))
+    t.start()
+    try:
+        satisfied.resolve(ConditionResult.SATISFIED)  # Repeated result must not resolve the other condition
+        t.join(0.2)
+        assert t.is_alive()
+        assert not waiting.termination
+
+        pending.resolve(ConditionResult.SATISFIED)
+        t.join(2)
+        assert not t.is_alive()
+        assert waiting.termination.status == TerminationStatus.COMPLETED
+    finally:
+        waiting.stop()
+        t.join(2)
+
+
+class FakeQueuedRun:
+
+    def __init__(self, instance_id, state, created_at, dispatch_result=True):
+        self.instance_id = instance_id
+        self.metadata = instance_id
+        self.state = state
+        self.created_at = created_at
+        self.dispatch_result = dispatch_result
+
+    def find_phase(self, _phase_filter):
+        return SimpleNamespace(variables={ExecutionQueue.STATE: self.state.name},
+                               lifecycle=SimpleNamespace(created_at=self.created_at))
+
+
+class FakeQueueEnvironment:
+
+    def __init__(self, runs):
+        self.runs = {run.instance_id: run for run in runs}
+        self.signalled = []
+
+    def get_active_runs(self, _run_match):
+        return list(self.runs.values())
+
+    def get_instance(self, instance_id):
+        return SimpleNamespace(find_phase_control=lambda _: SimpleNamespace(
+            signal_dispatch=lambda: self._signal_dispatch(instance_id)))
+
+    def _signal_dispatch(self, instance_id):
+        self.signalled.append(instance_id)
+        run = self.runs[instance_id]
+        if run.dispatch_result:
+            run.state = QueuedState.DISPATCHED
+        return run.dispatch_result
+
+
+def _dispatch(max_executions, *runs):
+    env = FakeQueueEnvironment(runs)
+    queue = ExecutionQueue(ExecutionGroup('group', max_executions), TestPhase())
+    queue._dispatch_next(SimpleNamespace(environment=env))
+    return env.signalled
+
+
+def test_free_slots_filled_oldest_first():
+    signalled = _dispatch(2,
+                          FakeQueuedRun('newest', QueuedState.IN_QUEUE, 3),
+                          FakeQueuedRun('oldest', QueuedState.IN_QUEUE, 1),
+                          FakeQueuedRun('middle', QueuedState.IN_QUEUE, 2))
+
+    assert signalled == ['oldest', 'middle']
+
+
+def test_dispatch_stops_at_limit():
+    signalled = _dispatch(2,
+                          FakeQueuedRun('running1', QueuedState.DISPATCHED, 1),
+                          FakeQueuedRun('running2', QueuedState.DISPATCHED, 2),
+                          FakeQueuedRun('queued', QueuedState.IN_QUEUE, 3))
+
+    assert signalled == []
+
+
+def test_dispatched_runs_not_counted_twice():
+    signalled = _dispatch(3,
+                          FakeQueuedRun('running', QueuedState.DISPATCHED, 1),
+                          FakeQueuedRun('cancelled', QueuedState.IN_QUEUE, 2, dispatch_result=False),
+                          FakeQueuedRun('queued1', QueuedState.IN_QUEUE, 3),
+                          FakeQueuedRun('queued2', QueuedState.IN_QUEUE, 4),
+                          FakeQueuedRun('queued3', QueuedState.IN_QUEUE, 5))
+
+    # The already dispatched run takes one slot and the refused dispatch takes none
+    assert signalled == ['cancelled', 'queued1', 'queued2']
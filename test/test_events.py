@@ -35,6 +35,36 @@ def test_transition_dispatching():
     assert received_event == event
 
 
+def test_listener_started_after_dispatch():
+    dispatcher = TransitionDispatcher()
+    job_run = fake_job_run('j1', 'r1')
+
+    def transition(stage):
+        return InstanceTransitionEvent(
+            instance=job_run.metadata,
+            job_run=job_run,
+            is_root_phase=True,
+            phase_id=job_run.phases[0].phase_id,
+            new_stage=stage,
+            timestamp=(utc_now())
+        )
+
+    receiver = InstanceTransitionReceiver()
+    observer = GenericObserver()
+    receiver.add_observer_transition(observer)
+    ended = transition(Stage.ENDED)
+    try:
+        dispatcher.new_instance_transition(transition(Stage.RUNNING))  # No listener yet
+        receiver.start()
+        dispatcher.new_instance_transition(ended)
+    finally:
+        dispatcher.close()
+        receiver.close()
+
+    received_event = observer.updates.get(timeout=2)[1][0]
+    assert received_event == ended
+
+
 def test_output_dispatching():
     dispatcher = OutputDispatcher()
     receiver = InstanceOutputReceiver()
@@ -56,3 +86,23 @@ def test_output_dispatching():
 
     received_event = observer.updates.get(timeout=2)[1][0]
     assert received_event == event
+
+
+def test_output_sent_in_order():
+    dispatcher = OutputDispatcher()
+    receiver = InstanceOutputReceiver()
+    observer = GenericObserver()
+    receiver.add_observer_output(observer)
+    receiver.start()
+
+    metadata = JobInstanceMetadata('j1', 'r1', 'i1', {})
+    events = [InstanceOutputEvent(metadata, OutputLine(f"line {i}", False), utc_now()) for i in range(3)]
+
+    try:
+        for event in events:
+            dispatcher.new_instance_output(event)
+    finally:
+        dispatcher.close()
+        receiver.close()
+
+    assert [observer.updates.get(timeout=2)[1][0] for _ in events] == events
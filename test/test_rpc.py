@@ -1,3 +1,6 @@
+import importlib
+import json
+import sys
 from typing import List
 
 import pytest
@@ -7,7 +10,8 @@ from runtools.runcore.client import RemoteCallClient, TargetNotFoundError, Remot
 from runtools.runcore.criteria import JobRunCriteria
 from runtools.runcore.output import OutputLine
 from runtools.runcore.run import TerminationStatus
-from runtools.runjob import instance
+from runtools.runcore.util.json import ErrorCode
+from runtools.runjob import instance, jsonutil
 from runtools.runjob.server import RemoteCallServer
 from runtools.runjob.test.phase import TestPhase
 
@@ -37,6 +41,17 @@ def server(job_instances):
         server.close()
 
 
+@pytest.fixture(params=['default', 'stdlib'])
+def json_backend(request, monkeypatch):
+    if request.param == 'stdlib':
+        monkeypatch.setitem(sys.modules, 'orjson', None)  # Makes the import of the optional library fail
+        importlib.reload(jsonutil)
+    yield request.param
+    if request.param == 'stdlib':
+        monkeypatch.undo()
+        importlib.reload(jsonutil)
+
+
 def test_server_not_found():
     with pytest.raises(TargetNotFoundError):
         with RemoteCallClient() as c:
@@ -64,6 +79,32 @@ def test_active_runs(server):
     assert not results[0].error
 
 
+def test_active_runs_no_match(server):
+    with RemoteCallClient() as c:
+        assert not c.get_active_runs(server.address, JobRunCriteria.job_match('j3'))
+
+
+def test_unregistered_instance_not_matched(job_instances, server):
+    j1, _ = job_instances
+    server.unregister_instance(j1)
+
+    with RemoteCallClient() as c:
+        assert not c.get_active_runs(server.address, JobRunCriteria.job_match('j1'))
+        assert len(c.get_active_runs(server.address, JobRunCriteria.all())) == 1
+
+
+def test_active_runs_serialization_error(server, monkeypatch):
+    monkeypatch.setattr(JobRun, 'serialize', _failing_serialize)
+    request = {"jsonrpc": "2.0", "id": 1, "method": "get_active_runs",
+               "params": {"run_match": JobRunCriteria.all().serialize()}}
+
+    response = json.loads(server.handle(json.dumps(request)))
+
+    assert response['id'] == 1
+    assert response['error']['code'] == ErrorCode.METHOD_EXECUTION_ERROR.int_code
+    assert 'serialization failed' in response['error']['message']
+
+
 def test_stop(job_instances, server):
     j1, j2 = job_instances
 
@@ -82,6 +123,18 @@ def test_phase_op_release(job_instances, server):
     assert j2.find_phase_control_by_id(APPROVAL).is_released
 
 
+def test_phase_op_phase_not_found(job_instances, server):
+    _, j2 = job_instances
+    request = {"jsonrpc": "2.0", "id": 4, "method": "exec_phase_op",
+               "params": [j2.instance_id, 'no-phase', 'release']}
+
+    response = json.loads(server.handle(json.dumps(request)))
+
+    assert response['id'] == 4
+    assert response['error']['code'] == ErrorCode.PHASE_NOT_FOUND.int_code
+    assert not j2.find_phase_control_by_id(APPROVAL).is_released
+
+
 def test_tail(job_instances, server):
     j1, j2 = job_instances
     j1.output.new_output(OutputLine('Meditate, do not delay, lest you later regret it.', False, 'EXEC1'))
@@ -97,3 +150,57 @@ def test_tail(job_instances, server):
 
         output_lines = c.get_output_tail(server.address, j2.instance_id, max_lines=1)
         assert output_lines == [OutputLine('...samsara!', True, 'EXEC2')]
+
+
+def _failing_serialize(*_args, **_kwargs):
+    raise RuntimeError('serialization failed')
+
+
+def test_tail_serialization_error(job_instances, server, monkeypatch):
+    j1, _ = job_instances
+    j1.output.new_output(OutputLine('Unserializable', False, 'EXEC1'))
+    monkeypatch.setattr(OutputLine, 'serialize', _failing_serialize)
+    request = {"jsonrpc": "2.0", "id": 2, "method": "get_output_tail", "params": [j1.instance_id]}
+
+    response = json.loads(server.handle(json.dumps(request)))
+
+    assert response['id'] == 2
+    assert response['error']['code'] == ErrorCode.METHOD_EXECUTION_ERROR.int_code
+    assert 'serialization failed' in response['error']['message']
+
+
+def test_bytes_request(server):
+    request = {"jsonrpc": "2.0", "id": 3, "method": "get_active_runs",
+               "params": {"run_match": JobRunCriteria.job_match('j1').serialize()}}
+
+    response = json.loads(server.handle(json.dumps(request).encode()))
+
+    assert response['id'] == 3
+    assert [JobRun.deserialize(run).job_id for run in response['result']['retval']] == ['j1']
+
+
+def test_malformed_bytes_request(server, json_backend):
+    response = json.loads(server.handle(b'{"jsonrpc": "2.0", "method": "\xff"}'))
+
+    assert response['error']['code'] == ErrorCode.PARSE_ERROR.int_code
+
+
+def test_big_int_request_id(server, json_backend):
+    request_id = 123456789012345678901234567890
+    request = {"jsonrpc": "2.0", "id": request_id, "method": "get_active_runs",
+               "params": {"run_match": JobRunCriteria.job_match('j1').serialize()}}
+
+    response = json.loads(server.handle(json.dumps(request)))
+
+    assert response['id'] == request_id
+    assert [JobRun.deserialize(run).job_id for run in response['result']['retval']] == ['j1']
+
+
+def test_non_finite_constant_rejected(server, json_backend):
+    response = json.loads(server.handle('{"jsonrpc": "2.0", "id": 5, "method": "get_active_runs", "params": NaN}'))
+
+    assert response['error']['code'] == ErrorCode.PARSE_ERROR.int_code
+
+
+def test_non_finite_float_written_as_null(json_backend):
+    assert json.loads(jsonutil.dumps({'nan': float('nan'), 'inf': [float('inf')]})) == {'nan': None, 'inf': [None]}
@@ -36,6 +36,13 @@ def test_basic_sequence(sequential, ctx):
         assert child.termination.status == TerminationStatus.COMPLETED
 
 
+def test_stop_after_completion(sequential, ctx):
+    sequential.run(ctx)
+    sequential.stop()
+
+    assert sequential.termination.status == TerminationStatus.COMPLETED
+
+
 def test_failing_phase(ctx):
     """Test behavior when a phase fails"""
     failing_phase = TestPhase(EXEC1, fail=True)
@@ -80,3 +87,10 @@ def test_interruption(ctx):
         phase.run(ctx)
 
     assert phase.termination.status == TerminationStatus.INTERRUPTED
+
+
+def test_find_phase_control_by_id():
+    seq = SequentialPhase('seq', [TestPhase(EXEC1), SequentialPhase('nested', [TestPhase(APPROVAL, wait=True)])])
+
+    assert not seq.find_phase_control_by_id(APPROVAL).is_released
+    assert seq.find_phase_control_by_id('no_such_phase') is None